@@ -5,25 +5,39 @@
 
 import time
 import random
+import re
+import asyncio
+import functools
 import threading
 import os
 import queue
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 import tkinter as tk
-from tkinter import ttk, messagebox
-
-# Selenium imports are used at runtime; keep imports in try/except for environments where selenium isn't installed.
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.action_chains import ActionChains
-except Exception:
-    webdriver = None
-    By = None
-    Options = None
-    Service = None
-    ActionChains = None
+from tkinter import messagebox
+
+# Selenium is imported on first driver bring-up (see _import_selenium) so the GUI
+# paints without paying its import cost; names stay None where it isn't installed.
+webdriver = None
+Options = None
+Service = None
+ActionChains = None
+_selenium_imported = False
+
+
+def _import_selenium():
+    global webdriver, Options, Service, ActionChains, _selenium_imported
+    if _selenium_imported:
+        return
+    _selenium_imported = True
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.action_chains import ActionChains
+    except Exception:
+        webdriver = Options = Service = ActionChains = None
 
 # --------- CONFIG ----------
 CHROMEDRIVER_PATH = "/usr/local/bin/chromedriver"   # <-- change if needed
@@ -31,6 +45,7 @@ CHROME_BINARY = "/usr/bin/google-chrome"            # <-- change if needed
 SELENIUM_PROFILE = os.path.expanduser("~/selenium_profile_lite")  # persistent profile
 MIN_DELAY_DEFAULT = 1.0
 MAX_DELAY_DEFAULT = 2.5
+SCAN_CACHE_TTL = 3.0   # seconds a page scan is reused for the same URL when nothing was clicked
 
 PRESET_WORDS = ["Yes", "No", "Maybe", "Sure", "I agree"]
 TEXTAREA_SENTENCES = [
@@ -41,22 +56,201 @@ TEXTAREA_SENTENCES = [
 ]
 
 QUESTION_KEYWORDS = {
-    "yesno": ["support", "agree", "do you", "should", "is it", "yes/no", "would you"],
-    "numbers": ["age", "years", "how many", "number of", "how old"],
-    "favorite": ["favorite", "prefer", "which do you prefer"],
-    "opinion": ["thoughts", "comments", "suggestions", "opinion", "ideas", "why", "explain"],
-    "location": ["city", "state", "country", "where do you live", "residence"]
+    "yesno": ("support", "agree", "do you", "should", "is it", "yes/no", "would you"),
+    "numbers": ("age", "years", "how many", "number of", "how old"),
+    "favorite": ("favorite", "prefer", "which do you prefer"),
+    "opinion": ("thoughts", "comments", "suggestions", "opinion", "ideas", "why", "explain"),
+    "location": ("city", "state", "country", "where do you live", "residence")
 }
 
+
+def _keyword_re(kws):
+    # one C-level scan per category instead of a Python loop over substrings
+    return re.compile("|".join(re.escape(k) for k in kws))
+
+
+# matched against the lowercased question text, checked in this priority order
+_YESNO_RE = _keyword_re(QUESTION_KEYWORDS["yesno"])
+_NUMBERS_RE = _keyword_re(QUESTION_KEYWORDS["numbers"])
+_FAVORITE_RE = _keyword_re(QUESTION_KEYWORDS["favorite"])
+_OPINION_RE = _keyword_re(QUESTION_KEYWORDS["opinion"])
+
 HUMAN_WEIGHTS = {"radio": 0.7, "checkbox": 0.6, "dropdown": 0.8, "text": 0.9, "textarea": 0.9}
+_YES_WEIGHT = HUMAN_WEIGHTS["radio"]
 NEXT_BUTTON_TEXTS = ["next","submit","continue","enter","go","ok","agree","confirm","send","complete","finish","proceed","advance"]
 
+# --------- JS snippets (run in the page via execute_script) ----------
+# labelOf(el): first non-empty of enclosing <label>, previous sibling <label>,
+# aria-label, aria-labelledby target text(s); resolved entirely in the page.
+_LABEL_FN_JS = r"""
+function txt(n) { return n ? (n.innerText || n.textContent || '').trim() : ''; }
+function labelOf(el) {
+    var t = txt(el.closest('label'));
+    if (t) return t;
+    for (var p = el.previousElementSibling; p; p = p.previousElementSibling) {
+        if (p.tagName === 'LABEL') { t = txt(p); if (t) return t; }
+    }
+    t = (el.getAttribute('aria-label') || '').trim();
+    if (t) return t;
+    // aria-labelledby is a space-separated ID list
+    var ids = (el.getAttribute('aria-labelledby') || '').trim();
+    if (!ids) return '';
+    return ids.split(/\s+/).map(function (id) { return txt(document.getElementById(id)); })
+              .filter(Boolean).join(' ');
+}
+"""
+
+# control kinds, reported by the page scan as indexes into CONTROL_SELECTORS
+KIND_RADIO, KIND_CHECKBOX, KIND_SELECT, KIND_TEXT, KIND_TEXTAREA = range(5)
+CONTROL_SELECTORS = (
+    "input[type='radio'], [role='radio']",
+    "input[type='checkbox'], [role='checkbox']",
+    "select",
+    "input[type='text'], input:not([type]), [role='textbox']",
+    "textarea",
+)
+
+# Page snapshot: arguments[0] is CONTROL_SELECTORS. Returns one dict of
+# parallel columns, one row per control in kind/page order: els (handles),
+# kind, value, label (question text), optionText (the control's own choice
+# text: label, label[for], aria-label, then value), selected, multiple,
+# group (nearest fieldset / radiogroup / div container, so radios and
+# checkboxes arrive pre-grouped), options / optionEls (non-empty <option>
+# texts and handles, [] for non-selects); plus url.
+_PAGE_SCAN_JS = _LABEL_FN_JS + """
+var scan = {els: [], kind: [], value: [], label: [], optionText: [], selected: [],
+            multiple: [], group: [], options: [], optionEls: [], url: location.href};
+var containers = new Map();
+function optionTextOf(o) {
+    var t = txt(o.closest('label'));
+    if (!t && o.id) t = txt(document.querySelector('label[for="' + CSS.escape(o.id) + '"]'));
+    return t || (o.getAttribute('aria-label') || '').trim() || (o.value || '').trim();
+}
+function groupOf(el) {
+    var c = el.closest('fieldset, [role="radiogroup"], div') || el;
+    if (!containers.has(c)) containers.set(c, containers.size);
+    return containers.get(c);
+}
+arguments[0].forEach(function (selector, kind) {
+    document.querySelectorAll(selector).forEach(function (el) {
+        var value = el.value;
+        if (typeof value !== 'string') value = el.getAttribute('value') || '';
+        var opts = [], texts = [];
+        if (el.tagName === 'SELECT') {
+            Array.prototype.forEach.call(el.options, function (o) {
+                var t = (o.text || '').trim() || (o.getAttribute('value') || '').trim();
+                if (t) { opts.push(o); texts.push(t); }
+            });
+        }
+        scan.els.push(el);
+        scan.kind.push(kind);
+        scan.value.push(value);
+        scan.label.push(labelOf(el));
+        scan.optionText.push(optionTextOf(el));
+        scan.selected.push(!!el.checked || el.getAttribute('aria-checked') === 'true');
+        scan.multiple.push(!!el.multiple);
+        scan.group.push(groupOf(el));
+        scan.options.push(texts);
+        scan.optionEls.push(opts);
+    });
+});
+return scan;
+"""
+
+# CDP Runtime.evaluate expression: captcha iframe or visible "captcha" text
+_CAPTCHA_JS = """
+(function () {
+    var frames = document.querySelectorAll('iframe');
+    for (var i = 0; i < frames.length; i++) {
+        if (/recaptcha|hcaptcha|geetest/i.test(frames[i].src || '')) return true;
+    }
+    return !!document.body && /captcha/i.test(document.body.innerText || '');
+})()
+"""
+
+# arguments[0]: NEXT_BUTTON_TEXTS. Clicks the first button / submit / role=button
+# whose lowercased text contains a keyword, trying keywords in priority order.
+_NEXT_CLICK_JS = """
+var words = arguments[0];
+var btns = Array.prototype.slice.call(document.querySelectorAll('button, input[type=submit], [role=button]'));
+var texts = btns.map(function (b) { return (b.innerText || b.value || '').trim().toLowerCase(); });
+for (var w = 0; w < words.length; w++) {
+    for (var i = 0; i < btns.length; i++) {
+        if (texts[i].indexOf(words[w]) !== -1) {
+            btns[i].scrollIntoView({block: 'center'});
+            btns[i].click();
+            return true;
+        }
+    }
+}
+return false;
+"""
+
+# fallback click: scroll into view and dispatch the mouse sequence frameworks listen for
+_CLICK_JS = """
+var el = arguments[0];
+el.scrollIntoView({block: 'center'});
+function emit(n) { el.dispatchEvent(new MouseEvent(n, {bubbles: true, cancelable: true})); }
+emit('mouseover'); emit('mousemove'); emit('mousedown'); emit('mouseup'); emit('click');
+"""
+
+# click every element of arguments[0]; native click() already fires input/change
+_MULTI_CLICK_JS = """
+arguments[0].forEach(function (el) {
+    el.scrollIntoView({block: 'center'});
+    el.click();
+});
+"""
+
+# arguments[0]: fields, arguments[1]: values. Goes through the native value
+# setter and fires input/change so React/Vue state picks the values up.
+_FILL_JS = """
+var els = arguments[0], vals = arguments[1];
+for (var i = 0; i < els.length; i++) {
+    var el = els[i];
+    el.focus();
+    if ('value' in el) {
+        var d = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+        if (d && d.set) d.set.call(el, vals[i]); else el.value = vals[i];
+    } else {
+        el.textContent = vals[i];
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+
+def _indices_by_kind(scan):
+    # row indexes of the page scan, one list per control kind
+    by_kind = [[] for _ in CONTROL_SELECTORS]
+    for i, kind in enumerate(scan["kind"]):
+        by_kind[kind].append(i)
+    return by_kind
+
+
+def _group_controls(scan, indices):
+    # row indexes per container group, in page order
+    groups = {}
+    group_of = scan["group"]
+    for i in indices:
+        groups.setdefault(group_of[i], []).append(i)
+    return list(groups.values())
+
 
 # ---------- thread-safe logger for GUI ----------
+def _noop(*_):
+    pass
+
+
 class ThreadLogger:
+    __slots__ = ("q", "gui_log_callback", "_notify_gui")
+
     def __init__(self, gui_log_callback=None):
         self.q = queue.Queue()
-        self.gui_log_callback = gui_log_callback
+        # no-op defaults until a GUI attaches, so log() never branches on them
+        self.gui_log_callback = gui_log_callback or _noop
+        self._notify_gui = _noop
 
     def log(self, msg):
         ts = time.strftime("%H:%M:%S")
@@ -66,18 +260,18 @@ class ThreadLogger:
         except Exception:
             pass
         self.q.put(full)
+        # wake the Tk thread; its <<Log>> handler drains the queue
+        try:
+            self._notify_gui()
+        except Exception:
+            pass
 
-    def attach_gui(self, gui_log_callback):
+    def attach_gui(self, gui_log_callback, gui_root=None):
         self.gui_log_callback = gui_log_callback
+        if gui_root is not None:
+            self._notify_gui = functools.partial(gui_root.event_generate, "<<Log>>", when="tail")
 
     def flush_to_gui(self):
-        if not self.gui_log_callback:
-            while not self.q.empty():
-                try:
-                    _ = self.q.get_nowait()
-                except queue.Empty:
-                    break
-            return
         while True:
             try:
                 m = self.q.get_nowait()
@@ -93,27 +287,43 @@ _shared_logger = ThreadLogger()
 
 # --------- SurveyBot ----------
 class SurveyBot:
+    # fixed attribute set: slot access in the hot answer loops, no per-instance __dict__
+    __slots__ = ("log", "driver", "profile", "delay_min", "delay_max", "alive", "running",
+                 "thread", "loop", "_executor", "_task", "_prefer_js_click", "_page_url",
+                 "_scan_cache", "_scan_cache_ts", "lock",
+                 "_text_pool", "_textarea_pool", "_loaded_url", "_landing_url")
+
     def __init__(self, log_func=None):
         # log_func optional; default to shared logger
         self.log = log_func or _shared_logger.log
         self.driver = None
-        self.profile = {
+        self.set_profile({
             "name": "Default",
             "text": PRESET_WORDS[:],
             "textarea": TEXTAREA_SENTENCES[:],
             "description": "Balanced responses. Risk: Low."
-        }
+        })
         self.delay_min = MIN_DELAY_DEFAULT
         self.delay_max = MAX_DELAY_DEFAULT
         self.alive = False
         self.running = False
-        self.thread = None
+        self.thread = None      # runs self.loop forever
+        self.loop = None
+        self._executor = None   # single worker: WebDriver calls never overlap
+        self._task = None       # concurrent Future of the current _thread_main run
+        self._prefer_js_click = False
+        self._page_url = None   # page the click preference was learned on
+        self._scan_cache = None
+        self._scan_cache_ts = 0.0
+        self._loaded_url = None   # last URL passed to open_url ...
+        self._landing_url = None  # ... and where the browser ended up
         self.lock = threading.Lock()
 
     # ---------- Driver ----------
     def create_driver_if_needed(self):
         if self.driver is not None:
             return
+        _import_selenium()
         if webdriver is None:
             raise RuntimeError("Selenium is not installed in this environment.")
         try:
@@ -121,45 +331,95 @@ class SurveyBot:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1200,900")
+            # skip background work the bot never needs
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-features=Translate,MediaRouter")
             chrome_options.add_argument(f"--user-data-dir={SELENIUM_PROFILE}")
+            # driver.get returns on DOMContentLoaded; survey forms are usable by then
+            chrome_options.set_capability("pageLoadStrategy", "eager")
             if CHROME_BINARY:
                 chrome_options.binary_location = CHROME_BINARY
             service = Service(CHROMEDRIVER_PATH)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_window_size(1200, 900)
             self.log("🔧 Selenium Chrome started (persistent profile).")
         except Exception as e:
             self.log(f"❌ Failed to start browser: {e}")
             raise
 
+    def open_url(self, url):
+        # blocking; never call from the bot loop. Once the loop exists, run on its
+        # single worker so the navigation queues behind any in-flight pass call
+        executor = self._executor
+        if executor is not None:
+            return executor.submit(self._open_url, url).result()
+        return self._open_url(url)
+
+    def _open_url(self, url):
+        # start the browser if needed and navigate, unless it is still on the page we
+        # last opened for this URL; returns True when a page load happened
+        self.create_driver_if_needed()
+        if url == self._loaded_url and self.driver.current_url == self._landing_url:
+            return False
+        self.driver.get(url)
+        self._invalidate_scan()
+        self._loaded_url = url
+        self._landing_url = self.driver.current_url
+        return True
+
     # ---------- start / stop ----------
     def configure(self, url, dmin, dmax, profile):
         self.delay_min = float(dmin)
         self.delay_max = float(dmax)
-        self.profile = profile
+        self.set_profile(profile)
         # if driver not created yet, GUI will handle initial navigation; keep behavior safe
 
+    def set_profile(self, profile):
+        # answer pools are read per question; resolve them once per profile change
+        self.profile = profile
+        self._text_pool = profile.get("text", PRESET_WORDS)
+        self._textarea_pool = profile.get("textarea", TEXTAREA_SENTENCES)
+
     def start(self):
         with self.lock:
-            if not self.alive:
-                self.alive = True
-                self.running = True
-                self.thread = threading.Thread(target=self._thread_main, daemon=True)
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._executor = ThreadPoolExecutor(max_workers=1)
+                self.thread = threading.Thread(target=self._run_loop, args=(self.loop,), daemon=True)
                 self.thread.start()
+            # set both flags before scheduling: the loop thread may run _thread_main at once
+            first_start = not self.alive
+            self.alive = True
+            self.running = True
+            if self._task is None or self._task.done():
+                self._task = asyncio.run_coroutine_threadsafe(self._thread_main(), self.loop)
+            if first_start:
                 self.log("▶ Automation thread started.")
             else:
-                self.running = True
                 self.log("▶ Automation resumed.")
 
     def pause(self):
         self.running = False
+        if self._task is not None:
+            self._task.cancel()   # wakes the loop out of any pending await right away
         self.log("⏸ Paused.")
 
     def stop_and_close(self):
         self.running = False
         self.alive = False
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=0.4)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         try:
             if self.driver:
                 try:
@@ -167,364 +427,336 @@ class SurveyBot:
                 except Exception:
                     pass
                 self.driver = None
+                self._loaded_url = self._landing_url = None
                 self.log("🛑 Driver closed.")
         except Exception as e:
             self.log(f"❌ Error closing driver: {e}")
 
+    def _run_loop(self, loop):
+        asyncio.set_event_loop(loop)
+        self.log("Thread ready.")
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for t in pending:
+                t.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+            self.log("Thread stopped (alive=False).")
+
     # ---------- helpers ----------
+    async def _call(self, fn, *args):
+        # blocking Selenium call off the loop so it stays cancelable; the bot's own
+        # one-worker executor keeps a call still in flight after pause() from
+        # overlapping the next pass's calls on the same driver
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args))
+
     def _rand_delay(self):
-        return random.uniform(self.delay_min, self.delay_max) + random.uniform(0, 0.4)
+        # uniform over [delay_min, delay_max + 0.4]
+        return self.delay_min + random.random() * (self.delay_max - self.delay_min + 0.4)
 
-    def _interruptible_sleep(self):
-        total = self._rand_delay()
-        slept = 0.0
-        resolution = 0.1
-        while slept < total:
-            if not self.running:
-                return False
-            time.sleep(min(resolution, total - slept))
-            slept += resolution
-        return True
+    async def _interruptible_sleep(self):
+        # pause() cancels the task, which interrupts this sleep immediately
+        await asyncio.sleep(self._rand_delay())
+        return self.running
 
-    def _safe_click(self, el):
-        # try a sequence of ways to click, including dispatching events for React
+    async def _safe_click(self, el):
+        # try a sequence of ways to click, including dispatching events for React;
+        # once a page needed the JS path, go straight to it for the rest of that page
         if el is None:
             return False
-        try:
-            el.click()
-            return True
-        except Exception:
-            pass
-        if ActionChains is not None and self.driver is not None:
+        self._invalidate_scan()
+        if not self._prefer_js_click:
             try:
-                ActionChains(self.driver).move_to_element(el).click().perform()
+                await self._call(el.click)
                 return True
             except Exception:
                 pass
+            if ActionChains is not None and self.driver is not None:
+                try:
+                    await self._call(ActionChains(self.driver).move_to_element(el).click().perform)
+                    return True
+                except Exception:
+                    pass
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-            time.sleep(0.05)
-        except Exception:
-            pass
-        try:
-            # dispatch multiple events to trigger frameworks
-            self.driver.execute_script('''
-                var el = arguments[0];
-                function emit(n){ el.dispatchEvent(new MouseEvent(n, {bubbles:true, cancelable:true})); }
-                emit('mouseover'); emit('mousemove'); emit('mousedown'); emit('mouseup'); emit('click');
-                ''', el)
+            await self._call(self.driver.execute_script, _CLICK_JS, el)
+            self._prefer_js_click = True
             return True
         except Exception:
             self.log("❌ Click failed.")
             return False
 
-    def _get_label_text(self, el):
-        # try label ancestors and aria labels
-        try:
-            lbl = el.find_element(By.XPATH, "ancestor::label[1]")
-            txt = lbl.text.strip()
-            if txt:
-                return txt
-        except Exception:
-            pass
+    async def _safe_click_many(self, elements):
+        # click a batch in one round-trip; per-element _safe_click if the script fails
+        self._invalidate_scan()
         try:
-            lbl = el.find_element(By.XPATH, "preceding::label[1]")
-            txt = lbl.text.strip()
-            if txt:
-                return txt
+            await self._call(self.driver.execute_script, _MULTI_CLICK_JS, elements)
+            return [True] * len(elements)
         except Exception:
-            pass
-        try:
-            aria = (el.get_attribute("aria-label") or "").strip()
-            if aria:
-                return aria
-        except Exception:
-            pass
-        try:
-            labid = (el.get_attribute("aria-labelledby") or "").strip()
-            if labid:
-                nodes = self.driver.find_elements(By.ID, labid)
-                if nodes:
-                    return nodes[0].text.strip()
-        except Exception:
-            pass
-        return ""
+            return [await self._safe_click(el) for el in elements]
 
     def _detect_captcha(self):
+        # plain-JSON CDP evaluate: no element handles to marshal, one hop per loop
         try:
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            for f in iframes:
-                src = (f.get_attribute("src") or "").lower()
-                if "recaptcha" in src or "hcaptcha" in src or "geetest" in src:
-                    return True
-            if self.driver.find_elements(By.XPATH, "//*[contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'captcha')]"):
-                return True
-            return False
+            res = self.driver.execute_cdp_cmd("Runtime.evaluate",
+                                              {"expression": _CAPTCHA_JS, "returnByValue": True})
+            return bool(res.get("result", {}).get("value"))
         except Exception:
             return False
 
     # ---------- intelligence ----------
     def intelligent_answer(self, qtext, options=None, qtype="text"):
         q = (qtext or "").lower()
-        if any(k in q for k in QUESTION_KEYWORDS["yesno"]):
-            yes_weight = HUMAN_WEIGHTS.get("radio", 0.7)
-            return random.choices(["Yes","No"], weights=[yes_weight, 1-yes_weight])[0]
-        if any(k in q for k in QUESTION_KEYWORDS["numbers"]):
+        if _YESNO_RE.search(q):
+            return "Yes" if random.random() < _YES_WEIGHT else "No"
+        if _NUMBERS_RE.search(q):
             return str(random.randint(18, 65))
-        if options and any(k in q for k in QUESTION_KEYWORDS["favorite"]):
+        if options and _FAVORITE_RE.search(q):
             return random.choice(options)
-        if any(k in q for k in QUESTION_KEYWORDS["opinion"]):
+        if _OPINION_RE.search(q):
             # longer opinion responses sometimes
             if random.random() < 0.5:
-                return random.choice(self.profile.get("textarea", TEXTAREA_SENTENCES))
+                return random.choice(self._textarea_pool)
             else:
-                return random.choice(self.profile.get("text", PRESET_WORDS))
+                return random.choice(self._text_pool)
         if options:
             try:
                 return random.choice(options)
             except Exception:
                 return options[0]
-        return random.choice(self.profile.get("text", PRESET_WORDS))
+        return random.choice(self._text_pool)
 
     # ---------- answering routines ----------
-    def _answer_radios(self):
-        radios = self.driver.find_elements(By.CSS_SELECTOR, "input[type='radio'], [role='radio']")
-        if not radios:
-            return
-        seen = set()
-        for r in radios:
+    async def _page_scan(self):
+        # one round-trip: every form control on the page plus the metadata the answerers need
+        scan = await self._call(self.driver.execute_script, _PAGE_SCAN_JS, CONTROL_SELECTORS)
+        if scan["url"] != self._page_url:
+            self._page_url = scan["url"]
+            self._prefer_js_click = False
+        return scan
+
+    async def _page_scan_cached(self):
+        # reuse the last scan while it is fresh and nothing has been clicked, filled or
+        # navigated since (each of those invalidates it); no extra round-trip to check
+        now = time.monotonic()
+        if self._scan_cache is None or now - self._scan_cache_ts > SCAN_CACHE_TTL:
+            self._scan_cache = await self._page_scan()
+            self._scan_cache_ts = now
+        return self._scan_cache
+
+    def _invalidate_scan(self):
+        self._scan_cache = None
+
+    async def _answer_radios(self, scan, indices):
+        els, opt_text, selected = scan["els"], scan["optionText"], scan["selected"]
+        for group in _group_controls(scan, indices):
             if not self.running:
                 return
-            try:
-                anc = r.find_element(By.XPATH, "ancestor::div[1]")
-                cid = anc.get_attribute("data-interceptor-id") or anc.get_attribute("id") or str(hash(anc))
-            except Exception:
-                cid = str(hash(r))
-            if cid in seen:
-                continue
-            seen.add(cid)
-            try:
-                opts = anc.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-            except Exception:
-                opts = [r]
-            if any(o.is_selected() for o in opts):
+            if any(selected[i] for i in group):
                 continue
-            opts_text = []
-            for o in opts:
-                txt = (o.get_attribute("value") or o.get_attribute("aria-label") or self._get_label_text(o) or "").strip()
-                opts_text.append(txt or "<opt>")
-            question = self._get_label_text(r) or "question"
+            opts_text = [opt_text[i] or "<opt>" for i in group]
+            question = scan["label"][group[0]] or "question"
             pick_text = self.intelligent_answer(question, opts_text, "radio")
             chosen = None
-            for i, o in enumerate(opts):
-                if opts_text[i].lower() == str(pick_text).lower():
-                    chosen = o
+            for i, t in zip(group, opts_text):
+                if t.lower() == str(pick_text).lower():
+                    chosen = i
                     break
             if chosen is None:
-                chosen = random.choice(opts)
-            if self._safe_click(chosen):
+                chosen = random.choice(group)
+            if await self._safe_click(els[chosen]):
                 self.log(f"[Radio] → {pick_text}")
-            if not self._interruptible_sleep():
+            if not await self._interruptible_sleep():
                 return
 
-    def _answer_checkboxes(self):
-        boxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox'], [role='checkbox']")
-        if not boxes:
-            return
-        seen = set()
-        for b in boxes:
+    async def _answer_checkboxes(self, scan, indices):
+        els, opt_text, selected = scan["els"], scan["optionText"], scan["selected"]
+        for group in _group_controls(scan, indices):
             if not self.running:
                 return
-            try:
-                anc = b.find_element(By.XPATH, "ancestor::div[1]")
-                cid = anc.get_attribute("id") or anc.get_attribute("data-interceptor-id") or str(hash(anc))
-            except Exception:
-                cid = str(hash(b))
-            if cid in seen:
-                continue
-            seen.add(cid)
-            try:
-                group = anc.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-            except Exception:
-                group = [b]
-            candidates = [g for g in group if not g.is_selected()]
+            candidates = [i for i in group if not selected[i]]
             if not candidates:
                 continue
             count = random.randint(2, min(5, len(candidates)))
             to_select = random.sample(candidates, count)
-            for s in to_select:
-                if not self.running:
-                    return
-                if self._safe_click(s):
-                    lab = self._get_label_text(s) or s.get_attribute("value") or "<box>"
-                    self.log(f"[Checkbox] → {lab}")
-                if not self._interruptible_sleep():
-                    return
-
-    def _answer_selects(self):
-        selects = self.driver.find_elements(By.TAG_NAME, "select")
-        for sel in selects:
+            clicked = await self._safe_click_many([els[i] for i in to_select])
+            for i, ok in zip(to_select, clicked):
+                if ok:
+                    self.log(f"[Checkbox] → {opt_text[i] or '<box>'}")
+            # the wall-clock pause is what looks human, not the spacing between hops
+            if not await self._interruptible_sleep():
+                return
+
+    async def _answer_selects(self, scan, indices):
+        for i in indices:
             if not self.running:
                 return
             try:
-                opts = sel.find_elements(By.TAG_NAME, "option")
-                candidates = [(o, (o.get_attribute("value") or o.text or "").strip()) for o in opts if (o.get_attribute("value") or o.text).strip() != ""]
-                if not candidates:
+                vals, opt_els = scan["options"][i], scan["optionEls"][i]
+                if not vals:
                     continue
-                vals = [v for (_, v) in candidates]
-                question = self._get_label_text(sel) or "select"
-                is_multiple = sel.get_attribute("multiple")
-                if is_multiple:
-                    count = random.randint(2, min(5, len(candidates)))
-                    chosen = random.sample([el for (el, _) in candidates], count)
-                    for el in chosen:
+                question = scan["label"][i] or "select"
+                if scan["multiple"][i]:
+                    count = random.randint(2, min(5, len(vals)))
+                    for j in random.sample(range(len(vals)), count):
                         if not self.running: return
-                        self._safe_click(el)
-                        self.log(f"[Multi-Select] → {el.text.strip() or el.get_attribute('value')}")
-                        if not self._interruptible_sleep(): return
+                        await self._safe_click(opt_els[j])
+                        self.log(f"[Multi-Select] → {vals[j]}")
+                        if not await self._interruptible_sleep(): return
                 else:
                     pick = self.intelligent_answer(question, vals, qtype="dropdown")
-                    chosen_el = None
-                    for (el, v) in candidates:
+                    chosen = None
+                    for j, v in enumerate(vals):
                         if v.lower() == pick.lower():
-                            chosen_el = el
+                            chosen = j
                             break
-                    if chosen_el is None:
-                        chosen_el = random.choice([el for (el, _) in candidates])
-                    self._safe_click(chosen_el)
-                    self.log(f"[Select] → {chosen_el.text.strip() or chosen_el.get_attribute('value')}")
+                    if chosen is None:
+                        chosen = random.randrange(len(vals))
+                    await self._safe_click(opt_els[chosen])
+                    self.log(f"[Select] → {vals[chosen]}")
             except Exception as e:
                 self.log(f"❌ Select error: {e}")
-            if not self._interruptible_sleep():
+            if not await self._interruptible_sleep():
                 return
 
-    def _answer_texts(self):
-        inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input:not([type]), [role='textbox']")
-        for inp in inputs:
-            if not self.running:
-                return
-            try:
-                cur = (inp.get_attribute("value") or "").strip()
-                if cur:
-                    continue
-                question = self._get_label_text(inp) or "text"
-                ans = self.intelligent_answer(question, qtype="text")
-                try:
-                    inp.clear()
-                except Exception:
-                    pass
-                inp.send_keys(ans)
-                self.log(f"[Text] → {ans}")
-            except Exception as e:
-                self.log(f"❌ Text fill error: {e}")
-            if not self._interruptible_sleep():
-                return
+    async def _answer_texts(self, scan, indices):
+        await self._fill_fields(scan, indices, "text", "Text")
 
-    def _answer_textareas(self):
-        areas = self.driver.find_elements(By.TAG_NAME, "textarea")
-        for ta in areas:
-            if not self.running:
-                return
-            try:
-                cur = (ta.get_attribute("value") or "").strip()
-                if cur:
-                    continue
-                question = self._get_label_text(ta) or "textarea"
-                ans = self.intelligent_answer(question, qtype="textarea")
-                try:
-                    ta.clear()
-                except Exception:
-                    pass
-                ta.send_keys(ans)
-                self.log(f"[Textarea] → {ans}")
-            except Exception as e:
-                self.log(f"❌ Textarea fill error: {e}")
-            if not self._interruptible_sleep():
-                return
+    async def _answer_textareas(self, scan, indices):
+        await self._fill_fields(scan, indices, "textarea", "Textarea")
 
-    def _click_next_if_any(self):
+    async def _fill_fields(self, scan, indices, qtype, tag):
+        # answer every empty field locally, then set all values in one script call
+        els, values, labels = scan["els"], scan["value"], scan["label"]
+        todo, answers = [], []
+        for i in indices:
+            if values[i].strip():
+                continue
+            todo.append(els[i])
+            answers.append(self.intelligent_answer(labels[i] or qtype, qtype=qtype))
+        if not todo or not self.running:
+            return
+        self._invalidate_scan()
         try:
-            for t in NEXT_BUTTON_TEXTS:
-                btns = self.driver.find_elements(By.XPATH,
-                    f"//button[contains(translate(normalize-space(.),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'{t}')]")
-                for btn in btns:
-                    if self._safe_click(btn):
-                        self.log("🟢 Clicked Next/Submit")
-                        return True
-            for t in NEXT_BUTTON_TEXTS:
-                btns = self.driver.find_elements(By.XPATH,
-                    f"//input[@type='submit' and contains(translate(@value,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'{t}')]")
-                for btn in btns:
-                    if self._safe_click(btn):
-                        self.log("🟢 Clicked Submit")
-                        return True
-            try:
-                forms = self.driver.find_elements(By.TAG_NAME, "form")
-                for f in forms:
-                    sub = f.find_elements(By.TAG_NAME, "button")
-                    for b in sub:
-                        if b.text and any(x in b.text.lower() for x in NEXT_BUTTON_TEXTS):
-                            if self._safe_click(b):
-                                self.log("🟢 Clicked Next (form button)")
-                                return True
-            except Exception:
-                pass
+            await self._call(self.driver.execute_script, _FILL_JS, todo, answers)
+            for ans in answers:
+                self.log(f"[{tag}] → {ans}")
+        except Exception as e:
+            self.log(f"❌ {tag} fill error: {e}")
+        await self._interruptible_sleep()
+
+    async def _click_next_if_any(self):
+        try:
+            if await self._call(self.driver.execute_script, _NEXT_CLICK_JS, NEXT_BUTTON_TEXTS):
+                self.log("🟢 Clicked Next/Submit")
+                return True
             return False
         except Exception as e:
             self.log(f"❌ Next button search error: {e}")
             return False
 
     # ---------- loop ----------
-    def _thread_main(self):
-        self.log("Thread ready.")
-        while self.alive:
-            if not self.running:
-                time.sleep(0.12)
-                continue
-            try:
-                if self._detect_captcha():
-                    self.log("⚠️ Captcha detected - please solve it in browser. Automation paused.")
-                    self.running = False
-                    continue
-                self._answer_radios()
-                if not self.running: continue
-                self._answer_checkboxes()
-                if not self.running: continue
-                self._answer_texts()
-                if not self.running: continue
-                self._answer_textareas()
-                if not self.running: continue
-                self._answer_selects()
-                if not self.running: continue
-
-                clicked = self._click_next_if_any()
-                if not clicked:
-                    self.log("⚠️ No next/submit — automation paused for this page.")
+    async def _thread_main(self):
+        # one run per start()/resume; returns when paused, stopped or stuck on a page
+        try:
+            while self.alive and self.running:
+                try:
+                    if await self._call(self._detect_captcha):
+                        self.log("⚠️ Captcha detected - please solve it in browser. Automation paused.")
+                        self._invalidate_scan()
+                        self.running = False
+                        continue
+                    scan = await self._page_scan_cached()
+                    by_kind = _indices_by_kind(scan)
+                    await self._answer_radios(scan, by_kind[KIND_RADIO])
+                    if not self.running: continue
+                    await self._answer_checkboxes(scan, by_kind[KIND_CHECKBOX])
+                    if not self.running: continue
+                    await self._answer_texts(scan, by_kind[KIND_TEXT])
+                    if not self.running: continue
+                    await self._answer_textareas(scan, by_kind[KIND_TEXTAREA])
+                    if not self.running: continue
+                    await self._answer_selects(scan, by_kind[KIND_SELECT])
+                    if not self.running: continue
+
+                    clicked = await self._click_next_if_any()
+                    if clicked:
+                        self._invalidate_scan()
+                    else:
+                        self.log("⚠️ No next/submit — automation paused for this page.")
+                        self.running = False
+                except Exception as e:
+                    self.log(f"❌ Automation loop error: {e}")
                     self.running = False
-            except Exception as e:
-                self.log(f"❌ Automation loop error: {e}")
-                self.running = False
-        self.log("Thread stopped (alive=False).")
+        except asyncio.CancelledError:
+            pass
 
 
 # --------- GUI (dark/orange LANC-ish) ----------
+class ThemeKey(IntEnum):
+    DARK = 0
+    SLATE_BLUE = 1
+    RED_DARK = 2
+    GREEN_SLATE = 3
+
+
+_THEME_NAMES = {
+    ThemeKey.DARK: "Dark/Orange",
+    ThemeKey.SLATE_BLUE: "Slate/Blue",
+    ThemeKey.RED_DARK: "Red/Dark",
+    ThemeKey.GREEN_SLATE: "Green/Slate",
+}
+# palettes are shared, read-only and keyed by the selector's int value;
+# unknown ids fall back to _DEFAULT_THEME_KEY
+_THEMES_BY_ID = {
+    ThemeKey.DARK: {
+        "bg": "#1e1e1e", "fg": "#ffffff", "btn_bg": "#ff8a00",
+        "btn_fg": "#000", "entry_bg": "#2c2c2c", "entry_fg": "#ffffff",
+        "log_bg": "#121212"
+    },
+    ThemeKey.SLATE_BLUE: {
+        "bg": "#222633", "fg": "#e6eef8", "btn_bg": "#1e88e5",
+        "btn_fg": "#ffffff", "entry_bg": "#2b3140", "entry_fg": "#e6eef8",
+        "log_bg": "#23293a"
+    },
+    ThemeKey.RED_DARK: {
+        "bg": "#1b1b1b", "fg": "#f8d7d7", "btn_bg": "#d32f2f",
+        "btn_fg": "#ffffff", "entry_bg": "#2a2a2a", "entry_fg": "#ffffff",
+        "log_bg": "#23293a"
+    },
+    ThemeKey.GREEN_SLATE: {
+        "bg": "#17201a", "fg": "#dff5e1", "btn_bg": "#2e7d32",
+        "btn_fg": "#ffffff", "entry_bg": "#22312a", "entry_fg": "#dff5e1",
+        "log_bg": "#23293a"
+    },
+}
+_DEFAULT_THEME_KEY = ThemeKey.GREEN_SLATE
+_DEBOUNCE_S = 0.3   # repeat Start/Open presses within this window are ignored
+_LOG_FLUSH_MS = 50  # log lines arriving within this window are written in one insert
+_VALIDATION_CLEAR_MS = 4000
+
+
 class SurveyGUI:
     def __init__(self, bot: SurveyBot):
         self.bot = bot
-        _shared_logger.attach_gui(self._gui_log)
         self.bot.log = _shared_logger.log
 
         self.root = tk.Tk()
+        self.root.bind("<<Log>>", self._on_log_event)
         self.root.title("Lite Survey Interceptor")
         self.root.geometry("980x700")
         self.root.configure(bg="#1e1e1e")
         self.root.tk.call('tk', 'scaling', 1.0)
 
         # theme / style
-        self.current_theme = {
-            "bg": "#1e1e1e", "fg": "#ffffff", "btn_bg": "#ff8a00",
-            "btn_fg": "#000", "entry_bg": "#2c2c2c", "entry_fg": "#ffffff"
-        }
+        self._applied_theme_key = ThemeKey.DARK
+        self._last_start_ts = 0.0
+        self._bringup_busy = False   # a background driver bring-up is in flight
+        self._pause_requested = False  # Pause pressed during that bring-up
+        self._log_queue = collections.deque()
+        self._log_flush_scheduled = False
+        self.current_theme = _THEMES_BY_ID[self._applied_theme_key]
 
         # profiles
         self.profiles_data = {
@@ -554,15 +786,20 @@ class SurveyGUI:
         self.create_dashboard_panel()
         self.create_profiles_panel()
         self.create_settings_panel()
+        # panels are fixed after construction; iterate a tuple, not the dict view
+        self._panels_tuple = tuple(self.panels.values())
         self.show_panel("Dashboard")
+        self._themed_buttons = (self.start_btn, self.pause_btn, self.save_profile_btn)
 
         # status
-        self.status_var = tk.StringVar(value="Idle")
+        self._last_status = "Idle"
+        self.status_var = tk.StringVar(value=self._last_status)
         status = tk.Label(self.root, textvariable=self.status_var, bg="#111111", fg="#ffa500", anchor="w")
         status.pack(fill="x", side="bottom")
 
-        # schedule flush
-        self.root.after(100, self._periodic_flush_logs)
+        # log_box exists now: route logging here and deliver anything logged before
+        _shared_logger.attach_gui(self._gui_log, self.root)
+        self.root.after_idle(self._on_log_event)
 
     def apply_rounded_corners(self, widget):
         try:
@@ -570,9 +807,8 @@ class SurveyGUI:
         except Exception:
             pass
 
-    def _periodic_flush_logs(self):
+    def _on_log_event(self, event=None):
         _shared_logger.flush_to_gui()
-        self.root.after(100, self._periodic_flush_logs)
 
     # Panels
     def create_dashboard_panel(self):
@@ -598,20 +834,30 @@ class SurveyGUI:
         cfg_frame = tk.Frame(panel, bg=self.current_theme["bg"])
         cfg_frame.pack(fill="x", pady=6)
         tk.Label(cfg_frame, text="Min(s):", fg=self.current_theme["fg"], bg=self.current_theme["bg"]).grid(row=0, column=0, sticky="w")
-        self.min_delay = tk.Entry(cfg_frame, width=6, bg=self.current_theme["entry_bg"], fg=self.current_theme["entry_fg"])
-        self.min_delay.insert(0, str(MIN_DELAY_DEFAULT))
+        self.min_delay_var = tk.StringVar(value=str(MIN_DELAY_DEFAULT))
+        self.min_delay = tk.Entry(cfg_frame, width=6, textvariable=self.min_delay_var, bg=self.current_theme["entry_bg"], fg=self.current_theme["entry_fg"])
         self.min_delay.grid(row=0, column=1, padx=4)
         tk.Label(cfg_frame, text="Max(s):", fg=self.current_theme["fg"], bg=self.current_theme["bg"]).grid(row=0, column=2, sticky="w")
-        self.max_delay = tk.Entry(cfg_frame, width=6, bg=self.current_theme["entry_bg"], fg=self.current_theme["entry_fg"])
-        self.max_delay.insert(0, str(MAX_DELAY_DEFAULT))
+        self.max_delay_var = tk.StringVar(value=str(MAX_DELAY_DEFAULT))
+        self.max_delay = tk.Entry(cfg_frame, width=6, textvariable=self.max_delay_var, bg=self.current_theme["entry_bg"], fg=self.current_theme["entry_fg"])
         self.max_delay.grid(row=0, column=3, padx=4)
+        # parse on edit, not on every Start press
+        self.min_delay_var.trace_add("write", self._on_delay_change)
+        self.max_delay_var.trace_add("write", self._on_delay_change)
+        self._on_delay_change()
 
         tk.Label(cfg_frame, text="Active Profile:", fg=self.current_theme["fg"], bg=self.current_theme["bg"]).grid(row=0, column=4, padx=(12,0))
-        self.active_profile_label = tk.Label(cfg_frame, text=self.bot.profile.get("name","Default"), fg="#ffc87a", bg=self.current_theme["bg"])
+        self._last_profile_name = self.bot.profile.get("name", "Default")
+        self.active_profile_label = tk.Label(cfg_frame, text=self._last_profile_name, fg="#ffc87a", bg=self.current_theme["bg"])
         self.active_profile_label.grid(row=0, column=5)
 
+        # inline validation messages (non-modal)
+        self.validation_var = tk.StringVar(value="")
+        self._validation_clear_id = None
+        tk.Label(panel, textvariable=self.validation_var, fg="#ff8080", bg=self.current_theme["bg"]).pack(anchor="w")
+
         tk.Label(panel, text="Log:", fg="#ffa500", bg=self.current_theme["bg"]).pack(anchor="w", pady=(8,0))
-        self.log_box = tk.Text(panel, bg="#121212", fg="#ffffff", height=22, wrap="word")
+        self.log_box = tk.Text(panel, bg=self.current_theme["log_bg"], fg="#ffffff", height=22, wrap="word")
         self.log_box.pack(fill="both", expand=True, pady=6)
         self.log_tag_index = 0
         self.log_box.tag_configure("odd", foreground="#ffffff")
@@ -619,12 +865,34 @@ class SurveyGUI:
 
         self.panels["Dashboard"] = panel
 
-    def _gui_log(self, msg):
+    def _on_delay_change(self, *_):
         try:
+            self._dmin_cached = float(self.min_delay_var.get())
+            self._dmax_cached = float(self.max_delay_var.get())
+            self._delays_valid = 0 <= self._dmin_cached <= self._dmax_cached
+        except ValueError:
+            self._delays_valid = False
+
+    def _gui_log(self, msg):
+        # queue the line; one insert per _LOG_FLUSH_MS window however many arrive
+        self._log_queue.append(msg)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(_LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        chunks = []
+        while self._log_queue:
             tag = "even" if (self.log_tag_index % 2 == 0) else "odd"
-            self.log_box.insert("end", msg + "\n", (tag,))
-            self.log_box.see("end")
+            chunks += (self._log_queue.popleft() + "\n", (tag,))
             self.log_tag_index += 1
+        if not chunks:
+            return
+        try:
+            # Text.insert takes alternating text/tags pairs: keeps per-line colours
+            self.log_box.insert("end", *chunks)
+            self.log_box.see("end")
         except Exception:
             pass
 
@@ -662,11 +930,16 @@ class SurveyGUI:
         tk.Label(panel, text="Settings", fg="#ffa500", bg=self.current_theme["bg"], font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0,10))
 
         tk.Label(panel, text="Theme:", fg=self.current_theme["fg"], bg=self.current_theme["bg"]).pack(anchor="w")
-        self.theme_var = tk.StringVar(value="Dark/Orange")
-        themes = ["Dark/Orange", "Slate/Blue", "Red/Dark", "Green/Slate"]
-        self.theme_combo = ttk.Combobox(panel, textvariable=self.theme_var, values=themes, state="readonly")
-        self.theme_combo.pack(anchor="w", pady=5)
-        self.theme_combo.bind("<<ComboboxSelected>>", self.change_theme)
+        # plain ints: before 3.11 str(IntEnum) is "ThemeKey.DARK", which Tcl rejects
+        self.theme_var = tk.IntVar(value=int(self._applied_theme_key))
+        theme_frame = tk.Frame(panel, bg=self.current_theme["bg"])
+        theme_frame.pack(anchor="w", pady=5)
+        for key, name in _THEME_NAMES.items():
+            rb = tk.Radiobutton(theme_frame, text=name, variable=self.theme_var, value=int(key),
+                                fg=self.current_theme["fg"], bg=self.current_theme["entry_bg"],
+                                selectcolor="#505050", font=("Segoe UI", 10),
+                                command=self.change_theme)
+            rb.pack(anchor="w", pady=2, padx=4, fill="x")
 
         tk.Label(panel, text="Selenium profile folder:", fg=self.current_theme["fg"], bg=self.current_theme["bg"]).pack(anchor="w", pady=(12,0))
         self.profile_path_label = tk.Label(panel, text=SELENIUM_PROFILE, bg=self.current_theme["bg"], fg="#ddd")
@@ -675,7 +948,7 @@ class SurveyGUI:
         self.panels["Settings"] = panel
 
     def show_panel(self, name):
-        for p in self.panels.values():
+        for p in self._panels_tuple:
             p.pack_forget()
         self.panels[name].pack(fill="both", expand=True)
         for n, btn in self.menu_buttons.items():
@@ -688,115 +961,189 @@ class SurveyGUI:
     def save_profile(self):
         p = self.profile_var.get()
         pd = self.profiles_data[p]
-        self.bot.profile = {
+        self.bot.set_profile({
             "name": p,
             "text": pd.get("text", PRESET_WORDS[:]),
             "textarea": pd.get("textarea", TEXTAREA_SENTENCES[:]),
             "description": pd.get("desc", "")
-        }
-        self.active_profile_label.config(text=p)
+        })
+        self.refresh_profile_label()
         _shared_logger.log(f"Profile saved and applied: {p} - {pd.get('desc')}")
         self._gui_log(f"[Profile] saved: {p} — {pd.get('desc')}")
 
+    def refresh_profile_label(self):
+        # every profile change goes through here; a text change re-runs geometry
+        name = self.bot.profile.get("name", "Default")
+        if name != self._last_profile_name:
+            self._last_profile_name = name
+            self.active_profile_label.config(text=name)
+
     def change_theme(self, event=None):
-        theme = self.theme_var.get()
-        if theme == "Dark/Orange":
-            self.current_theme = {
-                "bg": "#1e1e1e", "fg": "#ffffff", "btn_bg": "#ff8a00",
-                "btn_fg": "#000", "entry_bg": "#2c2c2c", "entry_fg": "#ffffff"
-            }
-        elif theme == "Slate/Blue":
-            self.current_theme = {
-                "bg": "#222633", "fg": "#e6eef8", "btn_bg": "#1e88e5",
-                "btn_fg": "#ffffff", "entry_bg": "#2b3140", "entry_fg": "#e6eef8"
-            }
-        elif theme == "Red/Dark":
-            self.current_theme = {
-                "bg": "#1b1b1b", "fg": "#f8d7d7", "btn_bg": "#d32f2f",
-                "btn_fg": "#ffffff", "entry_bg": "#2a2a2a", "entry_fg": "#ffffff"
-            }
-        else:  # Green/Slate
-            self.current_theme = {
-                "bg": "#17201a", "fg": "#dff5e1", "btn_bg": "#2e7d32",
-                "btn_fg": "#ffffff", "entry_bg": "#22312a", "entry_fg": "#dff5e1"
-            }
+        key = self.theme_var.get()
+        if key not in _THEMES_BY_ID:
+            key = _DEFAULT_THEME_KEY
+        if key == self._applied_theme_key:
+            return
+        self._applied_theme_key = key
+        self.current_theme = _THEMES_BY_ID[key]
         self.apply_theme()
 
+    def _configure_changed(self, widget, opts):
+        # Tk queues a redraw even for identical values; only write options that differ
+        changed = {k: v for k, v in opts.items() if widget.cget(k) != v}
+        if changed:
+            widget.configure(changed)
+
     def apply_theme(self):
-        self.root.configure(bg=self.current_theme["bg"])
-        self.main_panel.configure(bg=self.current_theme["bg"])
-        for panel in self.panels.values():
-            panel.configure(bg=self.current_theme["bg"])
-        try:
-            self.log_box.configure(bg="#121212" if self.current_theme["bg"].startswith("#1e") else "#23293a", fg=self.current_theme["fg"])
-        except Exception:
-            pass
-        try:
-            self.active_profile_label.configure(bg=self.current_theme["bg"], fg="#ffc87a")
-        except Exception:
-            pass
-        for btn in [self.start_btn, self.pause_btn, self.save_profile_btn]:
-            try:
-                btn.configure(bg=self.current_theme["btn_bg"], fg=self.current_theme["btn_fg"])
-            except Exception:
-                pass
+        theme = self.current_theme
+        bg = theme["bg"]
+        fg = theme["fg"]
+        btn_bg = theme["btn_bg"]
+        btn_fg = theme["btn_fg"]
+        bg_cfg = {"bg": bg}
+        btn_cfg = {"bg": btn_bg, "fg": btn_fg}
+        # only reached from the theme selector, so every widget below exists
+        self._configure_changed(self.root, bg_cfg)
+        self._configure_changed(self.main_panel, bg_cfg)
+        for panel in self._panels_tuple:
+            self._configure_changed(panel, bg_cfg)
+        self._configure_changed(self.log_box, {"bg": theme["log_bg"], "fg": fg})
+        self._configure_changed(self.active_profile_label, {"bg": bg, "fg": "#ffc87a"})
+        for btn in self._themed_buttons:
+            self._configure_changed(btn, btn_cfg)
+        # one coalesced redraw for everything queued above
+        self.root.update_idletasks()
 
     # Button handlers
-    def start_pressed(self):
-        url = self.url_entry.get().strip()
-        # validate delays
+    def _debounced(self):
+        # collapse double-clicks into one driver bring-up / navigation
+        now = time.monotonic()
+        if now - self._last_start_ts < _DEBOUNCE_S:
+            return True
+        self._last_start_ts = now
+        return False
+
+    def _post(self, fn, *args):
+        # run fn on the Tk thread; safe to call from worker threads
         try:
-            dmin = float(self.min_delay.get())
-            dmax = float(self.max_delay.get())
-            if dmin < 0 or dmax < 0 or dmin > dmax:
-                raise ValueError
+            self.root.after(0, fn, *args)
         except Exception:
-            messagebox.showwarning("Invalid delays", "Enter valid min/max (min <= max).")
-            return
-        # If driver exists and currently paused, resume without reloading
-        if self.bot.driver and self.bot.alive and not self.bot.running:
-            self.bot.delay_min = dmin
-            self.bot.delay_max = dmax
-            self.bot.start()
-            self.status_var.set("Running")
-            return
-        if not url:
-            messagebox.showwarning("No URL", "Enter the survey URL to intercept.")
+            pass  # window already closed
+
+    def _show_validation(self, msg):
+        self.validation_var.set(msg)
+        if self._validation_clear_id is not None:
+            self.root.after_cancel(self._validation_clear_id)
+        self._validation_clear_id = self.root.after(_VALIDATION_CLEAR_MS, self._clear_validation)
+
+    def _clear_validation(self):
+        if self._validation_clear_id is not None:
+            self.root.after_cancel(self._validation_clear_id)
+            self._validation_clear_id = None
+        if self.validation_var.get():
+            self.validation_var.set("")
+
+    def _set_status(self, status):
+        # StringVar.set fires traces and redraws the label even for the same value
+        if status != self._last_status:
+            self._last_status = status
+            self.status_var.set(status)
+
+    def _enable_start_btn(self):
+        self.start_btn.config(state="normal")
+
+    def start_pressed(self):
+        if self._bringup_busy or self._debounced():
             return
+        self.start_btn.config(state="disabled")
+        handed_off = False
         try:
-            # configure bot
-            self.bot.configure(url, dmin, dmax, self.bot.profile)
-            # create driver if needed
-            if not self.bot.driver:
-                self.bot.create_driver_if_needed()
-                # open url
-                try:
-                    self.bot.driver.get(url)
-                    self._gui_log(f"🌐 Opened {url} in Selenium browser.")
-                except Exception as e:
-                    self._gui_log(f"❌ Failed opening URL in driver: {e}")
-            # start automation thread
-            self.bot.start()
-            self.status_var.set("Running")
+            url = self.url_entry.get().strip()
+            # delays are parsed/validated as they are typed (_on_delay_change)
+            if not self._delays_valid:
+                self._show_validation("Enter valid min/max (min <= max).")
+                return
+            dmin, dmax = self._dmin_cached, self._dmax_cached
+            self._clear_validation()
+            # Bot already live (running or paused): pick up the new delays and resume on
+            # this thread; never navigate or touch the driver, its loop owns it now
+            if self.bot.driver is not None and self.bot.alive:
+                self.bot.delay_min = dmin
+                self.bot.delay_max = dmax
+                self.bot.start()
+                self._set_status("Running")
+                return
+            if not url:
+                self._show_validation("Enter the survey URL to intercept.")
+                return
+            try:
+                # configure bot
+                self.bot.configure(url, dmin, dmax, self.bot.profile)
+            except Exception as e:
+                self._gui_log(f"❌ Could not configure/start: {e}")
+                return
+            # browser start-up takes seconds: do it off the Tk thread. Only reached
+            # when no automation pass can be using the driver (none, or not alive)
+            self._bringup_busy = True
+            self._pause_requested = False
+            threading.Thread(target=self._bringup, args=(url,), daemon=True).start()
+            handed_off = True
+        finally:
+            if not handed_off:
+                # scheduled after the work, so clicks queued meanwhile hit a disabled button
+                self.root.after(int(_DEBOUNCE_S * 1000), self._enable_start_btn)
+
+    def _bringup(self, url, start_bot=True):
+        # worker thread: every widget update goes through _post
+        started = False
+        try:
+            self._ensure_driver_at(url)
+            started = start_bot
         except Exception as e:
-            self._gui_log(f"❌ Could not configure/start: {e}")
+            what = "configure/start" if start_bot else "open URL"
+            self._post(self._gui_log, f"❌ Could not {what}: {e}")
+        finally:
+            self._post(self._bringup_done, started)
+
+    def _bringup_done(self, start_bot):
+        # Tk thread, same as pause_pressed: a Pause pressed while Chrome was booting
+        # is seen here before the bot starts, with no window for it to slip through
+        self._bringup_busy = False
+        if start_bot:
+            if self._pause_requested:
+                self._set_status("Paused")
+            else:
+                # start automation thread
+                self.bot.start()
+                self._set_status("Running")
+        self._enable_start_btn()
 
     def pause_pressed(self):
+        if self._bringup_busy:
+            # no task to cancel yet; _bringup_done checks this before starting the bot
+            self._pause_requested = True
         self.bot.pause()
-        self.status_var.set("Paused")
+        self._set_status("Paused")
 
     def open_new_url(self):
+        if self._bringup_busy or self._debounced():
+            return
         url = self.url_entry.get().strip()
         if not url:
-            messagebox.showwarning("No URL", "Enter the survey URL to open.")
+            self._show_validation("Enter the survey URL to open.")
             return
-        try:
-            if not self.bot.driver:
-                self.bot.create_driver_if_needed()
-            self.bot.driver.get(url)
-            self._gui_log(f"🌐 Opened {url} in Selenium browser.")
-        except Exception as e:
-            self._gui_log(f"❌ Could not open URL: {e}")
+        self._clear_validation()
+        if self.bot.running:
+            # stop the pass first: its scan is for the page being replaced
+            self.pause_pressed()
+        # navigation (or Chrome start-up) blocks: same worker path as Start, minus the start
+        self._bringup_busy = True
+        threading.Thread(target=self._bringup, args=(url, False), daemon=True).start()
+
+    def _ensure_driver_at(self, url):
+        # bring-up thread only
+        if self.bot.open_url(url):
+            self._post(self._gui_log, f"🌐 Opened {url} in Selenium browser.")
 
     def quit_app(self):
         if messagebox.askyesno("Quit", "Quit and close browser?"):
@@ -807,8 +1154,7 @@ class SurveyGUI:
             self.root.destroy()
 
     def run(self):
-        _shared_logger.attach_gui(self._gui_log)
-        self.active_profile_label.config(text=self.bot.profile.get("name", "Default"))
+        self.refresh_profile_label()
         self.root.mainloop()
 
 